@@ -82,16 +82,79 @@ Example Usage:
     kit.save('modified.KIT')
 """
 
+import struct
+import warnings
+
+
+# Voice marker sequence (voice bytes 4-7)
+_MARKER = bytes((26, 24, 10, 22))
+_MARKER_LEN = len(_MARKER)
+
+# Main parameter block (voice bytes 8-25), in byte order
+_PARAM_STRUCT = struct.Struct('18B')
+_VOICE_PARAMS = (
+    'tune_quantized', 'tune',
+    'param1_quantized', 'param1',
+    'param2_quantized', 'param2',
+    'fx_send_quantized', 'fx_send',
+    'decay_quantized', 'decay',
+    'cutoff_quantized', 'cutoff',
+    'drive_quantized', 'drive',
+    'level_quantized', 'level',
+    'vcf', 'unused',
+)
+
+# Extra docstring detail for potentiometer properties
+_POT_DOC_NOTES = {'decay': ', max=255 is dial position 10'}
+
+# Valid toggle switch positions
+_TOGGLE_VALUES = frozenset((0, 1, 2))
+
+# Defaults used when widening a 26-byte voice into the voice 4 slot
+_EXTRA_PARAMS_DEFAULT = bytes((1, 0, 1, 0))
+_SAMPLER_PARAMS_DEFAULT = bytes((0, 0))
+
+# Empty voice templates for new kits (zeroed, marker set)
+_EMPTY_VOICE_26 = bytes(4) + _MARKER + bytes(18)
+_EMPTY_VOICE_30 = bytes(4) + _MARKER + bytes(22)
+
 
 class Voice:
     """Represents a single voice in a kit"""
 
+    __slots__ = ('data', 'is_voice4', 'has_sampler')
+
+    # Hardware-confirmed parameter accessors
+    # Based on hardware testing 2025-01
+    # Properties for these are generated below the class from these tables.
+
+    # Toggle switches: name -> byte offset (values 0, 1, 2)
+    _TOGGLE_OFFSETS = {
+        'algo': 0,
+        'mode': 2,
+        'vcf': 24,
+    }
+
+    # Potentiometers: name -> byte offset (values 0-255)
+    # Note: each is paired with the preceding *_QUANTIZED byte, relationship unclear
+    _POT_OFFSETS = {
+        'tune': 9,
+        'param1': 11,
+        'param2': 13,
+        'fx_send': 15,
+        'decay': 17,
+        'cutoff': 19,
+        'drive': 21,
+        'level': 23,
+    }
+
     def __init__(self, data):
         """
         Initialize voice from byte data
 
         Args:
-            data: bytes object containing voice data (26, 30, or 32 bytes)
+            data: bytes-like object containing voice data (26, 30, or 32 bytes),
+                  e.g. bytes, bytearray or memoryview; copied once into self.data
         """
         if len(data) not in (26, 30, 32):
             raise ValueError(f"Voice data must be 26, 30, or 32 bytes, got {len(data)}")
@@ -101,9 +164,66 @@ class Voice:
         self.has_sampler = len(data) == 32  # FORMAT 2 with sampler support
 
         # Validate marker
-        expected_marker = bytes([26, 24, 10, 22])
-        if self.data[4:8] != expected_marker:
-            print(f"Warning: Expected marker {list(expected_marker)}, got {list(self.data[4:8])}")
+        if self.data[4:8] != _MARKER:
+            warnings.warn(f"Expected marker {list(_MARKER)}, got {list(self.data[4:8])}",
+                          RuntimeWarning, stacklevel=2)
+
+    @classmethod
+    def _from_verified(cls, data):
+        """
+        Build a voice from data whose marker the caller has already checked
+
+        Used on the kit parsing path, where the marker was just located.
+
+        Args:
+            data: bytearray the voice takes ownership of (not copied)
+        """
+        if len(data) not in (26, 30, 32):
+            raise ValueError(f"Voice data must be 26, 30, or 32 bytes, got {len(data)}")
+
+        voice = cls.__new__(cls)
+        voice.data = data
+        voice.is_voice4 = len(data) in (30, 32)
+        voice.has_sampler = len(data) == 32
+        return voice
+
+    @classmethod
+    def from_params(cls, *, algo=0, mode=0, vcf=0, tune=0, param1=0, param2=0,
+                    fx_send=0, decay=0, cutoff=0, drive=0, level=0, is_voice4=False):
+        """
+        Create a new voice with all hardware controls set in one call
+
+        Values are validated up front and written straight into the voice data,
+        instead of going through each property setter in turn.
+
+        Args:
+            algo, mode, vcf: toggle switch values (0, 1, or 2)
+            tune, param1, param2, fx_send, decay, cutoff, drive, level:
+                potentiometer values (0-255)
+            is_voice4: create a 30-byte voice 4 instead of a 26-byte voice
+
+        Returns:
+            Voice object
+        """
+        toggles = (('algo', algo), ('mode', mode), ('vcf', vcf))
+        pots = (('tune', tune), ('param1', param1), ('param2', param2),
+                ('fx_send', fx_send), ('decay', decay), ('cutoff', cutoff),
+                ('drive', drive), ('level', level))
+
+        for name, value in toggles:
+            if value not in _TOGGLE_VALUES:
+                raise ValueError(f"{name.upper()} must be 0, 1, or 2")
+        if (tune | param1 | param2 | fx_send | decay | cutoff | drive | level) & ~0xFF:
+            for name, value in pots:
+                if value & ~0xFF:
+                    raise ValueError(f"{name.upper()} must be 0-255")
+
+        data = bytearray(_EMPTY_VOICE_30 if is_voice4 else _EMPTY_VOICE_26)
+        for name, value in toggles:
+            data[cls._TOGGLE_OFFSETS[name]] = value
+        for name, value in pots:
+            data[cls._POT_OFFSETS[name]] = value
+        return cls._from_verified(data)
 
     @property
     def pre_marker_params(self):
@@ -166,160 +286,95 @@ class Voice:
             raise ValueError("Sampler params must be 2 bytes")
         self.data[30:32] = value
 
-    # Hardware-confirmed parameter accessors
-    # Based on hardware testing 2025-01
+    def unpack_params(self):
+        """
+        Read all 18 main parameter bytes in one call
 
-    @property
-    def algo(self):
-        """Get ALGO toggle switch value (0, 1, or 2)"""
-        return self.data[0]
+        Returns:
+            dict mapping parameter name (e.g. 'tune', 'tune_quantized') to byte value
+        """
+        return dict(zip(_VOICE_PARAMS, _PARAM_STRUCT.unpack_from(self.data, 8)))
 
-    @algo.setter
-    def algo(self, value):
-        """Set ALGO toggle switch value (0, 1, or 2)"""
-        if value not in (0, 1, 2):
-            raise ValueError("ALGO must be 0, 1, or 2")
-        self.data[0] = value
+    def pack_params(self, **params):
+        """
+        Write several main parameter bytes in one call
 
-    @property
-    def mode(self):
-        """Get MODE toggle switch value (0, 1, or 2)"""
-        return self.data[2]
+        Args:
+            **params: parameter names as returned by unpack_params(), values 0-255
+                      (0, 1, or 2 for toggle switches such as 'vcf').
+                      Unspecified parameters keep their current value.
 
-    @mode.setter
-    def mode(self, value):
-        """Set MODE toggle switch value (0, 1, or 2)"""
-        if value not in (0, 1, 2):
-            raise ValueError("MODE must be 0, 1, or 2")
-        self.data[2] = value
+        Raises:
+            ValueError: if a name is unknown or a value is out of range
+            TypeError: if a value is not an int
+        """
+        unknown = set(params).difference(_VOICE_PARAMS)
+        if unknown:
+            raise ValueError(f"Unknown voice parameters: {', '.join(sorted(unknown))}")
+
+        for name, value in params.items():
+            if not isinstance(value, int):
+                raise TypeError(f"{name} must be an int, got {type(value).__name__}")
+            if name in self._TOGGLE_OFFSETS and value not in _TOGGLE_VALUES:
+                raise ValueError(f"{name.upper()} must be 0, 1, or 2")
+
+        values = self.unpack_params()
+        values.update(params)
+        try:
+            _PARAM_STRUCT.pack_into(self.data, 8, *[values[name] for name in _VOICE_PARAMS])
+        except struct.error as e:
+            raise ValueError("Parameter values must be 0-255") from e
 
-    @property
-    def vcf(self):
-        """Get VCF toggle switch value (0, 1, or 2)"""
-        return self.data[24]
+    def to_bytes(self):
+        """Convert voice back to bytes (Kit.to_bytes reads self.data directly)"""
+        return bytes(self.data)
 
-    @vcf.setter
-    def vcf(self, value):
-        """Set VCF toggle switch value (0, 1, or 2)"""
-        if value not in (0, 1, 2):
-            raise ValueError("VCF must be 0, 1, or 2")
-        self.data[24] = value
+    def __repr__(self):
+        return f"Voice(size={len(self.data)}, params={list(self.parameters[:6])}...)"
 
-    @property
-    def tune(self):
-        """Get TUNE potentiometer value (0-255)"""
-        return self.data[9]
-
-    @tune.setter
-    def tune(self, value):
-        """Set TUNE potentiometer value (0-255)"""
-        if not 0 <= value <= 255:
-            raise ValueError("TUNE must be 0-255")
-        self.data[9] = value
-        # Note: byte 8 (TUNE_QUANTIZED) is paired but relationship unclear
 
-    @property
-    def decay(self):
-        """Get DECAY potentiometer value (0-255, max=255 is dial position 10)"""
-        return self.data[17]
-
-    @decay.setter
-    def decay(self, value):
-        """Set DECAY potentiometer value (0-255, max=255 is dial position 10)"""
-        if not 0 <= value <= 255:
-            raise ValueError("DECAY must be 0-255")
-        self.data[17] = value
-        # Note: byte 16 (DECAY_QUANTIZED) is paired but relationship unclear
+def _toggle_property(name, offset):
+    """Build a property for a 3-position toggle switch at a fixed byte offset"""
+    label = name.upper()
 
-    @property
-    def param1(self):
-        """Get PARAM1 potentiometer value (0-255)"""
-        return self.data[11]
-
-    @param1.setter
-    def param1(self, value):
-        """Set PARAM1 potentiometer value (0-255)"""
-        if not 0 <= value <= 255:
-            raise ValueError("PARAM1 must be 0-255")
-        self.data[11] = value
-        # Note: byte 10 (PARAM1_QUANTIZED) is paired but relationship unclear
+    def getter(self):
+        return self.data[offset]
 
-    @property
-    def param2(self):
-        """Get PARAM2 potentiometer value (0-255)"""
-        return self.data[13]
-
-    @param2.setter
-    def param2(self, value):
-        """Set PARAM2 potentiometer value (0-255)"""
-        if not 0 <= value <= 255:
-            raise ValueError("PARAM2 must be 0-255")
-        self.data[13] = value
-        # Note: byte 12 (PARAM2_QUANTIZED) is paired but relationship unclear
+    def setter(self, value):
+        if value not in _TOGGLE_VALUES:
+            raise ValueError(f"{label} must be 0, 1, or 2")
+        self.data[offset] = value
 
-    @property
-    def cutoff(self):
-        """Get CUTOFF potentiometer value (0-255)"""
-        return self.data[19]
-
-    @cutoff.setter
-    def cutoff(self, value):
-        """Set CUTOFF potentiometer value (0-255)"""
-        if not 0 <= value <= 255:
-            raise ValueError("CUTOFF must be 0-255")
-        self.data[19] = value
-        # Note: byte 18 (CUTOFF_QUANTIZED) is paired but relationship unclear
+    return property(getter, setter, doc=f"Get {label} toggle switch value (0, 1, or 2)")
 
-    @property
-    def drive(self):
-        """Get DRIVE potentiometer value (0-255)"""
-        return self.data[21]
-
-    @drive.setter
-    def drive(self, value):
-        """Set DRIVE potentiometer value (0-255)"""
-        if not 0 <= value <= 255:
-            raise ValueError("DRIVE must be 0-255")
-        self.data[21] = value
-        # Note: byte 20 (DRIVE_QUANTIZED) is paired but relationship unclear
 
-    @property
-    def fx_send(self):
-        """Get FX_SEND potentiometer value (0-255)"""
-        return self.data[15]
-
-    @fx_send.setter
-    def fx_send(self, value):
-        """Set FX_SEND potentiometer value (0-255)"""
-        if not 0 <= value <= 255:
-            raise ValueError("FX_SEND must be 0-255")
-        self.data[15] = value
-        # Note: byte 14 (FX_SEND_QUANTIZED) is paired but relationship unclear
+def _pot_property(name, offset, note=''):
+    """Build a property for a potentiometer at a fixed byte offset"""
+    label = name.upper()
 
-    @property
-    def level(self):
-        """Get LEVEL potentiometer value (0-255)"""
-        return self.data[23]
-
-    @level.setter
-    def level(self, value):
-        """Set LEVEL potentiometer value (0-255)"""
-        if not 0 <= value <= 255:
-            raise ValueError("LEVEL must be 0-255")
-        self.data[23] = value
-        # Note: byte 22 (LEVEL_QUANTIZED) is paired but relationship unclear
+    def getter(self):
+        return self.data[offset]
 
-    def to_bytes(self):
-        """Convert voice back to bytes"""
-        return bytes(self.data)
+    def setter(self, value):
+        if value & ~0xFF:
+            raise ValueError(f"{label} must be 0-255")
+        self.data[offset] = value
 
-    def __repr__(self):
-        return f"Voice(size={len(self.data)}, params={list(self.parameters[:6])}...)"
+    return property(getter, setter, doc=f"Get {label} potentiometer value (0-255{note})")
+
+
+for _name, _offset in Voice._TOGGLE_OFFSETS.items():
+    setattr(Voice, _name, _toggle_property(_name, _offset))
+for _name, _offset in Voice._POT_OFFSETS.items():
+    setattr(Voice, _name, _pot_property(_name, _offset, _POT_DOC_NOTES.get(_name, '')))
+del _name, _offset
 
 
 class Kit:
     """Represents a complete .KIT file with header and 4 voices"""
 
+    __slots__ = ('header', 'voices')
+
     @staticmethod
     def create_header(header_size=57, voice_format=1):
         """
@@ -359,68 +414,82 @@ class Kit:
         return header
 
     @staticmethod
-    def _find_voice_boundaries(data):
+    def _find_markers(data):
         """
-        Find voice boundaries by locating marker sequences
+        Locate the marker sequence of each of the 4 voices
+
+        Voices 1-3 are always 26 bytes, so once the first marker is found the
+        other three are checked at their fixed offsets. The whole buffer is only
+        scanned if they are not there.
 
         Returns:
-            List of (start, end) tuples for each voice section
+            Tuple of the 4 marker offsets
         """
-        marker = bytes([26, 24, 10, 22])
-        marker_positions = []
+        first = data.find(_MARKER)
+        marker_positions = (first, first + 26, first + 52, first + 78)
 
-        for i in range(len(data) - len(marker) + 1):
-            if data[i:i+len(marker)] == marker:
-                marker_positions.append(i)
+        if first < 0 or not all(data.find(_MARKER, pos, pos + _MARKER_LEN) == pos
+                                for pos in marker_positions[1:]):
+            marker_positions = []
 
-        if len(marker_positions) != 4:
-            raise ValueError(f"Expected 4 voice markers, found {len(marker_positions)}")
+            # bytes.find does the scanning in C, no per-offset slicing.
+            # Stop at the fifth hit: that already proves the data is invalid, and
+            # large inputs (e.g. trailing sample data) aren't scanned to the end.
+            pos = first
+            while pos >= 0 and len(marker_positions) <= 4:
+                marker_positions.append(pos)
+                pos = data.find(_MARKER, pos + _MARKER_LEN)
 
-        # Voice starts 4 bytes before marker (pre-marker params)
-        voice_starts = [pos - 4 for pos in marker_positions]
-        voice_ends = voice_starts[1:] + [len(data)]
+            if len(marker_positions) > 4:
+                raise ValueError("Expected 4 voice markers, found more than 4")
+            if len(marker_positions) != 4:
+                raise ValueError(f"Expected 4 voice markers, found {len(marker_positions)}")
 
-        return list(zip(voice_starts, voice_ends))
+        return tuple(marker_positions)
 
     def __init__(self, data=None, header=None):
         """
         Initialize kit from byte data
 
         Args:
-            data: bytes object containing kit file data (variable length)
-            header: optional header bytes to use (for creating new kits)
+            data: kit file data (variable length) as any bytes-like object,
+                e.g. bytes, bytearray or memoryview
+            header: optional header bytes to use (for creating new kits); copied
+                into a new bytearray
         """
         if data is not None:
-            # Find voice boundaries dynamically
-            boundaries = self._find_voice_boundaries(data)
-
-            # Header is everything before first voice
-            header_size = boundaries[0][0]
-            self.header = bytearray(data[0:header_size])
-
-            # Extract voices
-            self.voices = []
-            for start, end in boundaries:
-                self.voices.append(Voice(data[start:end]))
+            # Marker search needs find(); other buffers are copied once up front
+            if not isinstance(data, (bytes, bytearray)):
+                data = bytes(data)
+
+            # Voices start 4 bytes before their marker (pre-marker params);
+            # the header is everything before the first voice
+            m0, m1, m2, m3 = self._find_markers(data)
+            v0, v1, v2, v3 = m0 - 4, m1 - 4, m2 - 4, m3 - 4
+
+            # Slice through a memoryview so only the final bytearrays copy
+            with memoryview(data) as view:
+                self.header = bytearray(view[:v0])
+                self.voices = [
+                    Voice._from_verified(bytearray(view[v0:v1])),
+                    Voice._from_verified(bytearray(view[v1:v2])),
+                    Voice._from_verified(bytearray(view[v2:v3])),
+                    Voice._from_verified(bytearray(view[v3:]))
+                ]
         else:
             # Create empty kit with proper markers and header
             if header is not None:
                 self.header = bytearray(header)
             else:
-                # Create proper header with size encoding
-                self.header = self.create_header(57)  # Default: 57 bytes (most common)
-
-            # Create voices with correct marker sequence
-            empty_voice_26 = bytearray(26)
-            empty_voice_26[4:8] = bytes([26, 24, 10, 22])  # Set marker
-            empty_voice_30 = bytearray(30)
-            empty_voice_30[4:8] = bytes([26, 24, 10, 22])  # Set marker
+                # Proper header with size encoding, 57 bytes (most common)
+                self.header = bytearray(_DEFAULT_HEADER)
 
+            # Voices copied from templates that already carry the marker
             self.voices = [
-                Voice(bytes(empty_voice_26)),
-                Voice(bytes(empty_voice_26)),
-                Voice(bytes(empty_voice_26)),
-                Voice(bytes(empty_voice_30))
+                Voice._from_verified(bytearray(_EMPTY_VOICE_26)),
+                Voice._from_verified(bytearray(_EMPTY_VOICE_26)),
+                Voice._from_verified(bytearray(_EMPTY_VOICE_26)),
+                Voice._from_verified(bytearray(_EMPTY_VOICE_30))
             ]
 
     @classmethod
@@ -435,8 +504,7 @@ class Kit:
             Kit object
         """
         with open(filename, 'rb') as f:
-            data = f.read()
-        return cls(data)
+            return cls(f.read())
 
     def to_bytes(self):
         """
@@ -445,10 +513,8 @@ class Kit:
         Returns:
             bytes object of complete kit (165 bytes)
         """
-        result = bytes(self.header)
-        for voice in self.voices:
-            result += voice.to_bytes()
-        return result
+        # Join the header and voice bytearrays in one copy
+        return b''.join([self.header, *(voice.data for voice in self.voices)])
 
     def save(self, filename):
         """
@@ -469,6 +535,9 @@ class Kit:
 
         Returns:
             Voice object
+
+        Raises:
+            ValueError: if index is not 0-3
         """
         if not 0 <= index < 4:
             raise ValueError("Voice index must be 0-3")
@@ -502,12 +571,14 @@ class Kit:
                 # Determine current kit format by checking existing voice 4
                 current_v4_size = len(self.voices[3].data) if len(self.voices) > 3 else 30
 
-                # Convert to appropriate size
-                new_data = bytearray(voice.data)
-                new_data.extend([1, 0, 1, 0])  # Add extra params
+                # Convert to appropriate size: add extra params, plus sampler params for FORMAT 2
+                suffix = _EXTRA_PARAMS_DEFAULT
                 if current_v4_size == 32:
-                    new_data.extend([0, 0])  # Add sampler params for FORMAT 2
-                voice = Voice(bytes(new_data))
+                    suffix += _SAMPLER_PARAMS_DEFAULT
+                new_data = bytearray(26 + len(suffix))
+                new_data[:26] = voice.data
+                new_data[26:] = suffix
+                voice = Voice._from_verified(new_data)
             elif len(voice.data) not in (30, 32):
                 raise ValueError(f"Voice 4 must be 26, 30, or 32 bytes")
 
@@ -517,6 +588,10 @@ class Kit:
         return f"Kit(header={len(self.header)} bytes, voices={len(self.voices)})"
 
 
+# Header template for new kits (see Kit.create_header)
+_DEFAULT_HEADER = bytes(Kit.create_header(57))
+
+
 def mix_kits(kit_files, voice_selections):
     """
     Create a new kit by mixing voices from different kit files
@@ -534,8 +609,18 @@ def mix_kits(kit_files, voice_selections):
     if len(voice_selections) != 4:
         raise ValueError("Must select exactly 4 voices")
 
-    # Load all kits
-    kits = [Kit.from_file(f) for f in kit_files]
+    # Validate selections before touching the disk
+    for kit_idx, voice_idx in voice_selections:
+        if kit_idx >= len(kit_files):
+            raise ValueError(f"Kit index {kit_idx} out of range")
+        if not 0 <= voice_idx < 4:
+            raise ValueError(f"Voice index {voice_idx} must be 0-3")
+
+    # Parse only the kits that are referenced (plus kit 0 for the header), once each
+    kits = {}
+    for kit_idx in [0] + [kit_idx for kit_idx, _ in voice_selections]:
+        if kit_idx not in kits:
+            kits[kit_idx] = Kit.from_file(kit_files[kit_idx])
 
     # Create new kit starting with first kit's header
     new_kit = Kit()
@@ -543,11 +628,6 @@ def mix_kits(kit_files, voice_selections):
 
     # Mix voices
     for target_idx, (kit_idx, voice_idx) in enumerate(voice_selections):
-        if kit_idx >= len(kits):
-            raise ValueError(f"Kit index {kit_idx} out of range")
-        if not 0 <= voice_idx < 4:
-            raise ValueError(f"Voice index {voice_idx} must be 0-3")
-
         source_voice = kits[kit_idx].get_voice(voice_idx)
         new_kit.set_voice(target_idx, source_voice)
 
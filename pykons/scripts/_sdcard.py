@@ -0,0 +1,209 @@
+"""
+Shared SD card helpers for the Perkons HD-01 scripts.
+"""
+
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from pykons import Kit
+
+
+# Zero-padded bank/kit IDs, indexed by number ('00'..'63')
+TWO_DIGIT = tuple(f"{num:02d}" for num in range(64))
+
+# Kit filenames as written by the device, indexed by kit number ('00.KIT'..'63.KIT')
+KIT_NAMES = tuple(f"{num_id}.KIT" for num_id in TWO_DIGIT)
+
+LOAD_WORKERS = 8  # concurrent kit file reads
+
+
+def check_sd_card_mounted(sd_path):
+    """
+    Check if the SD card is mounted at the expected path.
+
+    Args:
+        sd_path: Expected mount point of SD card
+
+    Returns:
+        True if SD card is mounted, False otherwise
+    """
+    # One stat call covers both the existence and the directory check
+    try:
+        st = os.stat(sd_path)
+    except OSError:
+        return False
+    return stat.S_ISDIR(st.st_mode)
+
+
+@lru_cache(maxsize=4)
+def get_banks_directory(sd_path):
+    """
+    Get the BANKS directory path on the SD card.
+
+    The mount point doesn't change during a run, so the result is memoized.
+
+    Args:
+        sd_path: SD card mount point
+
+    Returns:
+        Path string for BANKS directory
+    """
+    return os.path.join(sd_path, 'BANKS')
+
+
+def parse_kit_name(name):
+    """
+    Parse a kit filename of the form "NN.KIT" (extension in any case).
+
+    Args:
+        name: Filename (e.g., "05.KIT")
+
+    Returns:
+        Kit number 0-63, or -1 if the name is not a valid kit filename
+    """
+    if len(name) != 6:
+        return -1
+    a, b = name[0], name[1]
+    if not ('0' <= a <= '9' and '0' <= b <= '9'):
+        return -1
+    kit_num = (ord(a) - 48) * 10 + (ord(b) - 48)
+    if kit_num > 63 or name[2:].lower() != '.kit':
+        return -1
+    return kit_num
+
+
+@lru_cache(maxsize=128)
+def scan_bank(sd_path, bank_id, *, with_size=True):
+    """
+    Read a bank's KITS directory in one pass.
+
+    Results are cached for the rest of the run so repeated lookups of the
+    same bank don't touch the card again; call scan_bank.cache_clear()
+    after changing anything on the card.
+
+    Args:
+        sd_path: SD card mount point
+        bank_id: Bank ID (e.g., '01', '10')
+        with_size: Stat each kit file for its size; when False no stat calls
+            are made and every size is reported as 0. Keyword-only, so each
+            call spells it the same way and hits the same cache entry
+
+    Returns:
+        Tuple of (bank_exists: bool, kits_exists: bool, kit_entries: tuple,
+        total_size: int) where kit_entries holds one (filename, kit_num, size)
+        tuple per .KIT file (extension in any case); kit_num is -1 for files
+        not named "NN.KIT". An unreadable KITS directory is reported as empty
+    """
+    bank_path = os.path.join(get_banks_directory(sd_path), bank_id)
+    kits_path = os.path.join(bank_path, 'KITS')
+
+    try:
+        it = os.scandir(kits_path)
+    except (FileNotFoundError, NotADirectoryError):
+        return os.path.exists(bank_path), False, (), 0
+    except PermissionError:
+        return True, True, (), 0
+
+    # DirEntry caches the type and stat results
+    kit_entries = []
+    total_size = 0
+    with it:
+        for entry in it:
+            name = entry.name
+            if name.lower().endswith('.kit') and entry.is_file(follow_symlinks=False):
+                size = entry.stat(follow_symlinks=False).st_size if with_size else 0
+                kit_entries.append((name, parse_kit_name(name), size))
+                total_size += size
+
+    return True, True, tuple(kit_entries), total_size
+
+
+def inspect_bank(sd_path, bank_id):
+    """
+    Check whether a bank exists and count its .KIT files in one scan.
+
+    Args:
+        sd_path: SD card mount point
+        bank_id: Bank ID (e.g., '01', '10')
+
+    Returns:
+        Tuple of (exists: bool, kit_count: int)
+    """
+    bank_exists, _, kit_entries, _ = scan_bank(sd_path, bank_id, with_size=False)
+    return bank_exists, len(kit_entries)
+
+
+def list_volumes(volumes_dir='/Volumes'):
+    """
+    List mounted volumes, for suggesting an SD card path.
+
+    Args:
+        volumes_dir: Directory holding volume mount points
+
+    Returns:
+        List of volume directory paths (empty if volumes_dir doesn't exist)
+    """
+    try:
+        with os.scandir(volumes_dir) as it:
+            return [entry.path for entry in it if entry.is_dir(follow_symlinks=False)]
+    except FileNotFoundError:
+        return []
+
+
+def load_kit_files(tasks, pool_size=None):
+    """
+    Load kit files from the card, overlapping the per-file read latency.
+
+    map() keeps results in task order so seeded runs stay reproducible. Kits
+    that are missing or fail to load are made up from the next batch of
+    candidates.
+
+    Args:
+        tasks: List of (bank_id, kit_filename, kit_path) tuples, in load order
+        pool_size: Stop once this many kits have loaded (default: load all)
+
+    Returns:
+        List of (bank_id, kit_filename, kit, error) tuples, one per file read,
+        in task order; kit is None if the file is missing (error None) or
+        failed to load (error holds the exception)
+    """
+    if pool_size is None:
+        pool_size = len(tasks)
+
+    def load(kit_path):
+        try:
+            return Kit.from_file(kit_path), None
+        except FileNotFoundError:
+            return None, None
+        except Exception as e:
+            return None, e
+
+    results = []
+    loaded = 0
+    with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+        while tasks and loaded < pool_size:
+            batch_size = pool_size - loaded
+            batch, tasks = tasks[:batch_size], tasks[batch_size:]
+
+            for (bank_id, kit_filename, kit_path), (kit, error) in zip(
+                    batch, executor.map(load, [task[2] for task in batch])):
+                results.append((bank_id, kit_filename, kit, error))
+                if kit is not None:
+                    loaded += 1
+
+    return results
+
+
+def build_voice_pools(kits):
+    """
+    Collect the candidate voices for each voice position.
+
+    Args:
+        kits: List of Kit objects to draw voices from
+
+    Returns:
+        List of 4 lists; entry i holds voice i of every kit
+    """
+    return [[kit.get_voice(voice_idx) for kit in kits] for voice_idx in range(4)]
@@ -33,39 +33,24 @@ Usage:
 
 import argparse
 import os
+import shutil
 import sys
-from pathlib import Path
 
+from pykons.scripts._sdcard import (
+    KIT_NAMES, TWO_DIGIT, check_sd_card_mounted, get_banks_directory, list_volumes,
+    scan_bank,
+)
 
 # SD Card Configuration
 DEFAULT_SD_PATH = '/Volumes/Untitled'
 SOURCE_BANKS = ['01', '02']
 
+# Kit filenames removed when cleaning each source bank
+_BANK01_DELETE = frozenset(KIT_NAMES[32:64])
+_BANK02_DELETE = frozenset(KIT_NAMES[0:32])
 
-def check_sd_card_mounted(sd_path):
-    """
-    Check if the SD card is mounted at the expected path.
-
-    Args:
-        sd_path: Expected mount point of SD card
-
-    Returns:
-        True if SD card is mounted, False otherwise
-    """
-    return os.path.exists(sd_path) and os.path.isdir(sd_path)
-
-
-def get_banks_directory(sd_path):
-    """
-    Get the BANKS directory path on the SD card.
-
-    Args:
-        sd_path: SD card mount point
-
-    Returns:
-        Path object for BANKS directory
-    """
-    return Path(sd_path) / 'BANKS'
+# Whether entries can be unlinked relative to an open directory fd
+UNLINK_DIR_FD = os.unlink in os.supports_dir_fd and hasattr(os, 'O_DIRECTORY')
 
 
 def normalize_bank_id(bank_input):
@@ -85,7 +70,7 @@ def normalize_bank_id(bank_input):
         bank_num = int(bank_input)
         if not 0 <= bank_num <= 63:
             raise ValueError(f"Bank number must be between 0 and 63, got {bank_num}")
-        return f"{bank_num:02d}"
+        return TWO_DIGIT[bank_num]
     except ValueError as e:
         if "invalid literal" in str(e):
             raise ValueError(f"Bank must be a number between 0-63, got '{bank_input}'")
@@ -101,21 +86,13 @@ def get_bank_info(sd_path, bank_id):
         bank_id: Bank ID (e.g., '01', '10')
 
     Returns:
-        Tuple of (exists: bool, kit_files: list, total_size: int)
+        Tuple of (exists: bool, kit_entries: list, total_size: int) where
+        kit_entries holds one (kit_num, size) tuple per .KIT file; kit_num
+        is -1 for files that are not named "NN.KIT"
     """
-    bank_path = get_banks_directory(sd_path) / bank_id
-
-    if not bank_path.exists():
-        return False, [], 0
+    exists, _, kit_entries, total_size = scan_bank(sd_path, bank_id)
 
-    kits_path = bank_path / 'KITS'
-    if not kits_path.exists():
-        return True, [], 0
-
-    kit_files = sorted(list(kits_path.glob('*.KIT')) + list(kits_path.glob('*.kit')))
-    total_size = sum(f.stat().st_size for f in kit_files if f.is_file())
-
-    return True, kit_files, total_size
+    return exists, [(kit_num, size) for _, kit_num, size in kit_entries], total_size
 
 
 def get_kit_ranges_for_cleaning(bank_id):
@@ -126,16 +103,41 @@ def get_kit_ranges_for_cleaning(bank_id):
         bank_id: Bank ID ('01' or '02')
 
     Returns:
-        Tuple of (keep_range: range, delete_range: range, description: str)
+        Tuple of (keep_range: range, delete_range: range, delete_names: frozenset,
+        description: str), where delete_names holds the upper-case kit filenames
+        to remove
     """
     if bank_id == '01':
         # Bank 01: Keep 00-31, delete 32-63
-        return (range(0, 32), range(32, 64), "kits 32-63")
+        return (range(0, 32), range(32, 64), _BANK01_DELETE, "kits 32-63")
     elif bank_id == '02':
         # Bank 02: Keep 32-63, delete 00-31
-        return (range(0, 32), range(32, 64), "kits 00-31")
+        return (range(32, 64), range(0, 32), _BANK02_DELETE, "kits 00-31")
     else:
-        return (None, None, None)
+        return (None, None, None, None)
+
+
+def _remove_tree(path):
+    """
+    Recursively remove a directory, unlinking entries relative to a directory fd.
+
+    Each unlink resolves only the entry name against the open directory instead
+    of walking the full path again, which is noticeably cheaper on SD cards.
+
+    Args:
+        path: Directory to remove
+    """
+    dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    _remove_tree(entry.path)
+                else:
+                    os.unlink(entry.name, dir_fd=dir_fd)
+    finally:
+        os.close(dir_fd)
+    os.rmdir(path)
 
 
 def delete_entire_bank(sd_path, bank_id):
@@ -149,18 +151,21 @@ def delete_entire_bank(sd_path, bank_id):
     Returns:
         Tuple of (success: bool, message: str)
     """
-    import shutil
+    bank_path = os.path.join(get_banks_directory(sd_path), bank_id)
 
-    bank_path = get_banks_directory(sd_path) / bank_id
-
-    if not bank_path.exists():
+    if not os.path.isdir(bank_path):
         return True, "Bank does not exist (nothing to delete)"
 
     try:
-        shutil.rmtree(bank_path)
+        if UNLINK_DIR_FD:
+            _remove_tree(bank_path)
+        else:
+            shutil.rmtree(bank_path)
         return True, f"Successfully deleted bank {bank_id}"
     except Exception as e:
         return False, f"Failed to delete bank: {e}"
+    finally:
+        scan_bank.cache_clear()
 
 
 def clean_source_bank(sd_path, bank_id):
@@ -174,30 +179,44 @@ def clean_source_bank(sd_path, bank_id):
     Returns:
         Tuple of (success: bool, message: str, deleted_count: int)
     """
-    keep_range, delete_range, description = get_kit_ranges_for_cleaning(bank_id)
+    keep_range, delete_range, delete_names, description = get_kit_ranges_for_cleaning(bank_id)
 
     if keep_range is None:
         return False, "Invalid bank ID for cleaning", 0
 
-    kits_path = get_banks_directory(sd_path) / bank_id / 'KITS'
+    # Rescan rather than reuse the cached listing shown before confirmation,
+    # in case the card changed while the prompt was waiting
+    scan_bank.cache_clear()
+    _, kits_exists, kit_entries, _ = scan_bank(sd_path, bank_id)
 
-    if not kits_path.exists():
+    if not kits_exists:
         return True, f"Bank {bank_id} has no KITS directory (nothing to clean)", 0
 
+    kits_path = os.path.join(get_banks_directory(sd_path), bank_id, 'KITS')
     deleted_count = 0
     errors = []
 
-    # Delete kits in the delete range
-    for kit_num in delete_range:
-        kit_filename = f"{kit_num:02d}.KIT"
-        kit_path = kits_path / kit_filename
-
-        if kit_path.exists():
+    # Delete kits in the delete range, reusing the cached directory listing
+    dir_fd = os.open(kits_path, os.O_RDONLY | os.O_DIRECTORY) if UNLINK_DIR_FD else None
+    try:
+        for name, _, _ in kit_entries:
+            # Match the extension in any case, as the FAT card itself does
+            if name.upper() not in delete_names:
+                continue
             try:
-                kit_path.unlink()
+                if dir_fd is not None:
+                    os.unlink(name, dir_fd=dir_fd)
+                else:
+                    os.unlink(os.path.join(kits_path, name))
                 deleted_count += 1
+            except FileNotFoundError:
+                pass
             except Exception as e:
-                errors.append(f"Failed to delete {kit_filename}: {e}")
+                errors.append(f"Failed to delete {name}: {e}")
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+        scan_bank.cache_clear()
 
     if errors:
         error_msg = "\n  ".join(errors)
@@ -273,16 +292,14 @@ Notes:
             print(f"✗ Error: SD card not found at {args.sd_path}")
             print(f"  Please ensure the Perkons SD card is mounted.")
             print(f"\nAvailable volumes:")
-            volumes = Path('/Volumes').iterdir() if Path('/Volumes').exists() else []
-            for vol in volumes:
-                if vol.is_dir():
-                    print(f"    - {vol}")
+            for vol in list_volumes():
+                print(f"    - {vol}")
             return 1
 
         print(f"✓ SD card found at {args.sd_path}")
 
         # Get bank info
-        exists, kit_files, total_size = get_bank_info(args.sd_path, bank_id)
+        exists, kit_entries, total_size = get_bank_info(args.sd_path, bank_id)
 
         if not exists:
             print(f"\n✗ Error: Bank {bank_id} does not exist on SD card")
@@ -290,35 +307,27 @@ Notes:
 
         # Show what will be affected
         print(f"\nBank {bank_id} information:")
-        print(f"  Total kits: {len(kit_files)}")
+        print(f"  Total kits: {len(kit_entries)}")
         print(f"  Total size: {total_size:,} bytes")
 
         if is_source_bank:
             # Source bank - show cleaning details
-            keep_range, delete_range, description = get_kit_ranges_for_cleaning(bank_id)
-
-            # Count kits in delete range
-            delete_count = 0
-            delete_size = 0
-            for kit_file in kit_files:
-                kit_name = kit_file.stem
-                try:
-                    kit_num = int(kit_name)
-                    if kit_num in delete_range:
-                        delete_count += 1
-                        delete_size += kit_file.stat().st_size
-                except ValueError:
-                    pass
+            keep_range, delete_range, _, description = get_kit_ranges_for_cleaning(bank_id)
+
+            # Count kits in delete range from the sizes collected during the scan
+            delete_sizes = [size for kit_num, size in kit_entries if kit_num in delete_range]
+            delete_count = len(delete_sizes)
+            delete_size = sum(delete_sizes)
 
             print(f"\n⚠ This is a SOURCE BANK - cannot be deleted, only cleaned")
             print(f"  Will REMOVE: {description} ({delete_count} kits, {delete_size:,} bytes)")
-            print(f"  Will KEEP: kits {min(keep_range):02d}-{max(keep_range):02d}")
+            print(f"  Will KEEP: kits {TWO_DIGIT[min(keep_range)]}-{TWO_DIGIT[max(keep_range)]}")
 
             confirmation_text = f"clean bank {bank_id}"
         else:
             # Regular bank - show deletion details
             print(f"\n⚠ WARNING: This will DELETE the entire bank")
-            print(f"  All {len(kit_files)} kit(s) will be permanently removed")
+            print(f"  All {len(kit_entries)} kit(s) will be permanently removed")
             print(f"  This operation CANNOT be undone")
 
             confirmation_text = f"delete bank {bank_id}"
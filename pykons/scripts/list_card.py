@@ -24,37 +24,18 @@ Usage:
 import argparse
 import os
 import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
 
+from pykons.scripts._sdcard import (
+    TWO_DIGIT, check_sd_card_mounted, get_banks_directory, list_volumes,
+    scan_bank,
+)
 
 # SD Card Configuration
 DEFAULT_SD_PATH = '/Volumes/Untitled'
-
-
-def check_sd_card_mounted(sd_path):
-    """
-    Check if the SD card is mounted at the expected path.
-
-    Args:
-        sd_path: Expected mount point of SD card
-
-    Returns:
-        True if SD card is mounted, False otherwise
-    """
-    return os.path.exists(sd_path) and os.path.isdir(sd_path)
-
-
-def get_banks_directory(sd_path):
-    """
-    Get the BANKS directory path on the SD card.
-
-    Args:
-        sd_path: SD card mount point
-
-    Returns:
-        Path object for BANKS directory
-    """
-    return Path(sd_path) / 'BANKS'
+BANK_IDS = frozenset(TWO_DIGIT)  # '00'..'63'
+SCAN_WORKERS = 8  # concurrent bank directory scans
 
 
 def get_kit_numbers_in_bank(sd_path, bank_id):
@@ -68,32 +49,10 @@ def get_kit_numbers_in_bank(sd_path, bank_id):
     Returns:
         Sorted list of kit numbers (as integers)
     """
-    kits_path = get_banks_directory(sd_path) / bank_id / 'KITS'
-
-    if not kits_path.exists():
-        return []
-
-    kit_numbers = []
-    for kit_file in kits_path.glob('*.KIT'):
-        try:
-            # Extract kit number from filename (e.g., "05.KIT" -> 5)
-            kit_num = int(kit_file.stem)
-            if 0 <= kit_num <= 63:
-                kit_numbers.append(kit_num)
-        except ValueError:
-            # Skip files with non-numeric names
-            pass
+    # Only names are needed, so skip the per-file stat
+    _, _, kit_entries, _ = scan_bank(sd_path, bank_id, with_size=False)
 
-    # Also check lowercase .kit extension
-    for kit_file in kits_path.glob('*.kit'):
-        try:
-            kit_num = int(kit_file.stem)
-            if 0 <= kit_num <= 63 and kit_num not in kit_numbers:
-                kit_numbers.append(kit_num)
-        except ValueError:
-            pass
-
-    return sorted(kit_numbers)
+    return sorted({kit_num for _, kit_num, _ in kit_entries if kit_num >= 0})
 
 
 def format_kit_ranges(kit_numbers):
@@ -112,88 +71,85 @@ def format_kit_ranges(kit_numbers):
     Returns:
         String representation with ranges
     """
-    if not kit_numbers:
-        return ""
-
     ranges = []
-    start = kit_numbers[0]
-    end = kit_numbers[0]
-
-    for num in kit_numbers[1:]:
-        if num == end + 1:
-            # Extend current range
-            end = num
-        else:
-            # End current range and start new one
-            if start == end:
-                ranges.append(f"{start}")
-            else:
-                ranges.append(f"{start}..{end}")
-            start = num
-            end = num
-
-    # Add final range
-    if start == end:
-        ranges.append(f"{start}")
-    else:
-        ranges.append(f"{start}..{end}")
+    # Consecutive numbers share the same (number - position) key, so each
+    # group is one contiguous run
+    for _, run in groupby(enumerate(kit_numbers), lambda item: item[1] - item[0]):
+        start = end = next(run)[1]
+        for _, end in run:
+            pass
+        ranges.append(f"{start}" if start == end else f"{start}..{end}")
 
     return ", ".join(ranges)
 
 
-def scan_banks(sd_path):
+def scan_bank_full(sd_path, bank_id):
     """
-    Scan all banks on the SD card and return information about non-empty banks.
+    Collect kit numbers and total kit size for a bank in one directory pass.
 
     Args:
         sd_path: SD card mount point
+        bank_id: Bank ID (e.g., '01', '10')
 
     Returns:
-        Dictionary mapping bank_id -> list of kit numbers
+        Tuple of (kit_numbers: sorted list of ints, total_size: int bytes)
     """
-    banks_dir = get_banks_directory(sd_path)
-
-    if not banks_dir.exists():
-        return {}
-
-    banks_info = {}
+    _, _, kit_entries, total_size = scan_bank(sd_path, bank_id)
 
-    # Scan for all bank directories (00-63)
-    for bank_num in range(64):
-        bank_id = f"{bank_num:02d}"
-        bank_path = banks_dir / bank_id
+    # Every .KIT file counts towards the size; only "NN.KIT" names are kits.
+    # A set dedupes names that differ only in extension case
+    kit_numbers = {kit_num for _, kit_num, _ in kit_entries if kit_num >= 0}
 
-        if bank_path.exists() and bank_path.is_dir():
-            kit_numbers = get_kit_numbers_in_bank(sd_path, bank_id)
-
-            if kit_numbers:
-                banks_info[bank_id] = kit_numbers
-
-    return banks_info
+    return sorted(kit_numbers), total_size
 
 
-def calculate_total_size(sd_path, bank_id):
+def scan_banks(sd_path, with_size=True):
     """
-    Calculate total size of all kits in a bank.
+    Scan all banks on the SD card and return information about non-empty banks.
 
     Args:
         sd_path: SD card mount point
-        bank_id: Bank ID
+        with_size: Also total up kit file sizes; when False every size is 0
 
     Returns:
-        Total size in bytes
+        List of (bank_id, list of kit numbers, total size in bytes) tuples,
+        in ascending bank order
     """
-    kits_path = get_banks_directory(sd_path) / bank_id / 'KITS'
+    banks_dir = get_banks_directory(sd_path)
+
+    # List the bank directories (00-63) that exist with a single readdir,
+    # rather than probing all 64 possible names. Entries from scandir already
+    # exist, and is_dir(follow_symlinks=False) is answered from the cached
+    # dirent type without falling back to stat() for symlinks
+    try:
+        with os.scandir(banks_dir) as it:
+            bank_ids = [entry.name for entry in it
+                        if entry.name in BANK_IDS and entry.is_dir(follow_symlinks=False)]
+    except FileNotFoundError:
+        return []
 
-    if not kits_path.exists():
-        return 0
+    # Walk banks in name order so the result is already sorted for display
+    bank_ids.sort()
+    banks_info = []
 
-    total_size = 0
-    for kit_file in list(kits_path.glob('*.KIT')) + list(kits_path.glob('*.kit')):
-        if kit_file.is_file():
-            total_size += kit_file.stat().st_size
+    def scan_one(bank_id):
+        if with_size:
+            return scan_bank_full(sd_path, bank_id)
+        return get_kit_numbers_in_bank(sd_path, bank_id), 0
 
-    return total_size
+    # Overlap per-bank directory reads on slow cards; scandir/stat release
+    # the GIL. A couple of banks isn't worth starting a pool for.
+    if len(bank_ids) <= 2:
+        results = [scan_one(bank_id) for bank_id in bank_ids]
+    else:
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+            results = list(executor.map(scan_one, bank_ids))
+
+    for bank_id, (kit_numbers, total_size) in zip(bank_ids, results):
+        if kit_numbers:
+            banks_info.append((bank_id, kit_numbers, total_size))
+
+    return banks_info
 
 
 def format_size(size_bytes):
@@ -260,17 +216,15 @@ Notes:
             print(f"✗ Error: SD card not found at {args.sd_path}")
             print(f"  Please ensure the Perkons SD card is mounted.")
             print(f"\nAvailable volumes:")
-            volumes = Path('/Volumes').iterdir() if Path('/Volumes').exists() else []
-            for vol in volumes:
-                if vol.is_dir():
-                    print(f"    - {vol}")
+            for vol in list_volumes():
+                print(f"    - {vol}")
             return 1
 
         print(f"✓ SD card found")
 
         # Check if BANKS directory exists
         banks_dir = get_banks_directory(args.sd_path)
-        if not banks_dir.exists():
+        if not os.path.exists(banks_dir):
             print(f"\n✗ Error: BANKS directory not found at {banks_dir}")
             print(f"  The SD card may not be formatted for Perkons HD-01.")
             return 1
@@ -280,45 +234,46 @@ Notes:
 
         # Scan banks
         print("Scanning banks...")
-        banks_info = scan_banks(args.sd_path)
+        # Sizes are only shown in detailed mode; skip the stat calls otherwise
+        banks_info = scan_banks(args.sd_path, with_size=args.detailed)
 
         if not banks_info:
             print("\nNo banks with kits found on SD card.")
             print("The SD card appears to be empty or freshly formatted.")
             return 0
 
-        print(f"\nFound {len(banks_info)} bank(s) with kits:")
-        print("-" * 70)
+        # Collect the listing and write it in one go rather than one write per line
+        out = [f"\nFound {len(banks_info)} bank(s) with kits:", "-" * 70]
 
         total_kits = 0
         total_size = 0
 
-        for bank_id in sorted(banks_info.keys()):
-            kit_numbers = banks_info[bank_id]
+        for bank_id, kit_numbers, bank_size in banks_info:
             kit_count = len(kit_numbers)
             total_kits += kit_count
 
             if args.detailed:
                 # Detailed output with size information
-                bank_size = calculate_total_size(args.sd_path, bank_id)
                 total_size += bank_size
 
-                print(f"\nBank {bank_id}:")
-                print(f"  Kits: {kit_count}")
-                print(f"  Size: {format_size(bank_size)}")
-                print(f"  Kit numbers: {format_kit_ranges(kit_numbers)}")
+                out.append(f"\nBank {bank_id}:")
+                out.append(f"  Kits: {kit_count}")
+                out.append(f"  Size: {format_size(bank_size)}")
+                out.append(f"  Kit numbers: {format_kit_ranges(kit_numbers)}")
             else:
                 # Compact output
                 kit_ranges = format_kit_ranges(kit_numbers)
-                print(f"Bank {bank_id}: {kit_count:2d} kits  ({kit_ranges})")
+                out.append(f"Bank {bank_id}: {kit_count:2d} kits  ({kit_ranges})")
 
         # Summary
-        print()
-        print("-" * 70)
-        print(f"Total: {len(banks_info)} banks, {total_kits} kits")
+        out.append("")
+        out.append("-" * 70)
+        out.append(f"Total: {len(banks_info)} banks, {total_kits} kits")
 
         if args.detailed:
-            print(f"Total size: {format_size(total_size)}")
+            out.append(f"Total size: {format_size(total_size)}")
+
+        sys.stdout.write("\n".join(out) + "\n")
 
     except KeyboardInterrupt:
         print(f"\n\nAborted by user.")
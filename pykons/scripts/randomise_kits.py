@@ -30,10 +30,14 @@ import argparse
 import os
 import random
 import sys
-from pathlib import Path
+from datetime import datetime
 
 # Import from parent package
 from pykons import Kit
+from pykons.scripts._sdcard import (
+    build_voice_pools, check_sd_card_mounted, get_banks_directory, inspect_bank,
+    list_volumes, load_kit_files, scan_bank,
+)
 
 
 # SD Card Configuration
@@ -44,90 +48,8 @@ SOURCE_KIT_RANGES = {
     '02': range(32, 64)   # Kits 32-63
 }
 
-
-def check_sd_card_mounted(sd_path):
-    """
-    Check if the SD card is mounted at the expected path.
-
-    Args:
-        sd_path: Expected mount point of SD card
-
-    Returns:
-        True if SD card is mounted, False otherwise
-    """
-    return os.path.exists(sd_path) and os.path.isdir(sd_path)
-
-
-def get_banks_directory(sd_path):
-    """
-    Get the BANKS directory path on the SD card.
-
-    Args:
-        sd_path: SD card mount point
-
-    Returns:
-        Path object for BANKS directory
-    """
-    return Path(sd_path) / 'BANKS'
-
-
-def check_bank_exists(sd_path, bank_id):
-    """
-    Check if a bank exists on the SD card.
-
-    Args:
-        sd_path: SD card mount point
-        bank_id: Bank ID (e.g., '01', '10')
-
-    Returns:
-        True if bank directory exists, False otherwise
-    """
-    bank_path = get_banks_directory(sd_path) / bank_id
-    return bank_path.exists()
-
-
-def is_bank_empty(sd_path, bank_id):
-    """
-    Check if a bank is empty (no kits or only empty KITS directory).
-
-    Args:
-        sd_path: SD card mount point
-        bank_id: Bank ID (e.g., '01', '10')
-
-    Returns:
-        True if bank doesn't exist or has no .KIT files, False otherwise
-    """
-    bank_path = get_banks_directory(sd_path) / bank_id
-
-    if not bank_path.exists():
-        return True
-
-    kits_path = bank_path / 'KITS'
-    if not kits_path.exists():
-        return True
-
-    # Check if any .KIT files exist
-    kit_files = list(kits_path.glob('*.KIT')) + list(kits_path.glob('*.kit'))
-    return len(kit_files) == 0
-
-
-def get_kit_count_in_bank(sd_path, bank_id):
-    """
-    Count the number of .KIT files in a bank.
-
-    Args:
-        sd_path: SD card mount point
-        bank_id: Bank ID
-
-    Returns:
-        Number of .KIT files in the bank
-    """
-    kits_path = get_banks_directory(sd_path) / bank_id / 'KITS'
-    if not kits_path.exists():
-        return 0
-
-    kit_files = list(kits_path.glob('*.KIT')) + list(kits_path.glob('*.kit'))
-    return len(kit_files)
+# Whether files can be created relative to an open directory fd
+OPEN_DIR_FD = os.open in os.supports_dir_fd and hasattr(os, 'O_DIRECTORY')
 
 
 def validate_source_banks(sd_path):
@@ -138,48 +60,53 @@ def validate_source_banks(sd_path):
         sd_path: SD card mount point
 
     Returns:
-        Tuple of (success: bool, error_message: str or None)
+        Tuple of (success: bool, error_message: str or None, kit_entries: dict)
+        where kit_entries maps each source bank found to its scan_bank()
+        (filename, kit_num, size) entries, so callers needn't scan again
     """
     banks_dir = get_banks_directory(sd_path)
 
-    if not banks_dir.exists():
-        return False, f"BANKS directory not found on SD card at {banks_dir}"
+    if not os.path.exists(banks_dir):
+        return False, f"BANKS directory not found on SD card at {banks_dir}", {}
 
     missing_banks = []
     empty_banks = []
+    kit_entries = {}
 
     for bank_id in SOURCE_BANKS:
-        bank_path = banks_dir / bank_id
-        kits_path = bank_path / 'KITS'
-
-        if not bank_path.exists():
+        bank_exists, _, entries, _ = scan_bank(sd_path, bank_id, with_size=False)
+        if not bank_exists:
             missing_banks.append(bank_id)
             continue
 
-        if not kits_path.exists():
-            empty_banks.append(bank_id)
-            continue
-
-        # Check if bank has kits
-        kit_count = get_kit_count_in_bank(sd_path, bank_id)
-        if kit_count == 0:
+        # Check if bank has kits in its source range
+        kit_entries[bank_id] = entries
+        kit_range = SOURCE_KIT_RANGES[bank_id]
+        if not any(kit_num in kit_range for _, kit_num, _ in entries):
             empty_banks.append(bank_id)
 
     if missing_banks:
-        return False, f"Source banks not found: {', '.join(missing_banks)}"
+        return False, f"Source banks not found: {', '.join(missing_banks)}", kit_entries
 
     if empty_banks:
-        return False, f"Source banks are empty: {', '.join(empty_banks)}"
+        return False, f"Source banks are empty: {', '.join(empty_banks)}", kit_entries
 
-    return True, None
+    return True, None, kit_entries
 
 
-def load_source_kits(sd_path):
+def load_source_kits(sd_path, source_kit_entries, pool_size=None, rng=None):
     """
-    Load all source kits from banks 01 and 02.
+    Load source kits from banks 01 and 02.
 
     Args:
         sd_path: SD card mount point
+        source_kit_entries: Dict of {bank_id: scan_bank() kit entries} from
+            validate_source_banks(); only kits in each bank's source range
+            are loaded
+        pool_size: Stop once this many kits have loaded (default: load all).
+            When it is smaller than the number of source kits, the kits to
+            load are picked at random
+        rng: random.Random used to pick kits when pool_size applies
 
     Returns:
         List of Kit objects
@@ -187,40 +114,59 @@ def load_source_kits(sd_path):
     kits = []
     banks_dir = get_banks_directory(sd_path)
 
+    # Only files found by the validation scan are opened, one per kit number,
+    # in bank/kit order. There is no exists() probe; a kit that has
+    # disappeared since is skipped when its open fails
+    tasks = []
     for bank_id in SOURCE_BANKS:
         kit_range = SOURCE_KIT_RANGES[bank_id]
+        by_num = {}
+        for name, kit_num, _ in source_kit_entries.get(bank_id, ()):
+            if kit_num in kit_range:
+                by_num[kit_num] = name
+        kits_path = os.path.join(banks_dir, bank_id, 'KITS')
+        tasks.extend((bank_id, name, os.path.join(kits_path, name))
+                     for _, name in sorted(by_num.items()))
+
+    if pool_size is None or pool_size >= len(tasks):
+        pool_size = len(tasks)
+    else:
+        # Sample which kits to load; loading order follows the shuffle
+        (rng or random).shuffle(tasks)
 
-        for kit_num in kit_range:
-            kit_filename = f"{kit_num:02d}.KIT"
-            kit_path = banks_dir / bank_id / 'KITS' / kit_filename
+    # Report lines are collected and printed in one go
+    report = []
+    for bank_id, kit_filename, kit, error in load_kit_files(tasks, pool_size):
+        if kit is not None:
+            kits.append(kit)
+            report.append(f"  Loaded: {bank_id}/KITS/{kit_filename}")
+        elif error is not None:
+            report.append(f"  Warning: Failed to load {bank_id}/KITS/{kit_filename}: {error}")
 
-            if kit_path.exists():
-                try:
-                    kit = Kit.from_file(str(kit_path))
-                    kits.append(kit)
-                    print(f"  Loaded: {bank_id}/KITS/{kit_filename}")
-                except Exception as e:
-                    print(f"  Warning: Failed to load {bank_id}/KITS/{kit_filename}: {e}")
+    if report:
+        print("\n".join(report))
 
     return kits
 
 
-def select_header_for_format2(input_kits):
+def select_header_for_format2(input_kits, template_kit=None):
     """
     Select an appropriate header for FORMAT 2 output kits.
 
     Args:
         input_kits: List of Kit objects
+        template_kit: First FORMAT 2 kit in input_kits, if the caller has
+            already found it (saves searching again)
 
     Returns:
         bytearray header for new kits
     """
-    # Check if any kits are FORMAT 2 (voice 4 has 32 bytes)
-    format2_kits = [kit for kit in input_kits if len(kit.voices[3].data) == 32]
+    # Find the first FORMAT 2 kit (voice 4 has 32 bytes), if any
+    if template_kit is None:
+        template_kit = next((kit for kit in input_kits if len(kit.voices[3].data) == 32), None)
 
-    if format2_kits:
+    if template_kit is not None:
         # Use the first FORMAT 2 kit's header as template
-        template_kit = format2_kits[0]
         header = bytearray(template_kit.header)
         print(f"  Using header from FORMAT 2 kit: {len(header)} bytes")
     else:
@@ -231,35 +177,50 @@ def select_header_for_format2(input_kits):
     return header
 
 
-def generate_random_kit(input_kits, output_format=2, template_header=None):
+def select_voices(voice_pools, n_kits, rng):
     """
-    Generate a single random kit by selecting random voices from input kits.
+    Pick the four voices of every output kit up front.
 
     Args:
-        input_kits: List of Kit objects to mix from
-        output_format: 1 or 2 (default 2 for FORMAT 2)
-        template_header: Optional header to use for new kit
+        voice_pools: Per-position voice lists from build_voice_pools()
+        n_kits: Number of output kits
+        rng: random.Random instance to draw from
 
     Returns:
-        Kit object with randomly mixed voices
+        List of n_kits lists, each holding the 4 Voice objects for one kit
     """
-    # Create new kit with appropriate format
-    if template_header is not None:
-        new_kit = Kit(header=template_header)
-    else:
-        new_kit = Kit()
-        new_kit.header = Kit.create_header(header_size=57, voice_format=output_format)
+    choice = rng.choice
+    return [[choice(pool) for pool in voice_pools] for _ in range(n_kits)]
 
-    # For each voice position, randomly select from input kits
-    for voice_idx in range(4):
-        # Pick a random input kit
-        source_kit = random.choice(input_kits)
-        source_voice = source_kit.get_voice(voice_idx)
 
-        # Set the voice in new kit
-        new_kit.set_voice(voice_idx, source_voice)
+def write_kit_files(output_path, kit_files):
+    """
+    Write serialized kits into the output directory.
+
+    Files are created relative to one open handle on the output directory,
+    so each open only has to resolve the kit filename.
 
-    return new_kit
+    Args:
+        output_path: Output KITS directory
+        kit_files: List of (filename, data) tuples
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    dir_fd = os.open(output_path, os.O_RDONLY | os.O_DIRECTORY) if OPEN_DIR_FD else None
+    try:
+        for kit_filename, data in kit_files:
+            if dir_fd is not None:
+                fd = os.open(kit_filename, flags, 0o666, dir_fd=dir_fd)
+            else:
+                fd = os.open(os.path.join(output_path, kit_filename), flags, 0o666)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
 
 
 def format_kit_filename(kit_number):
@@ -335,6 +296,8 @@ Notes:
   - Source banks 01 and 02 must exist and contain kits
   - Output bank must be 0-63 (excluding 01 and 02)
   - Output kits numbered 00.KIT through (N-1).KIT
+  - Voices are mixed from up to --pool-size source kits (default 4 x N,
+    16-64); when that is fewer than available, the kits are picked at random
         """
     )
 
@@ -342,6 +305,9 @@ Notes:
                         help='Destination bank number (0-63, excluding 01 and 02)')
     parser.add_argument('--n', type=int, default=32,
                         help='Number of output kits to generate (default: 32)')
+    parser.add_argument('--pool-size', type=int, default=None,
+                        help='Number of source kits to load and mix from '
+                             '(default: 4 x N, between 16 and 64)')
     parser.add_argument('--seed', type=int, default=None,
                         help='Random seed for reproducibility (optional)')
     parser.add_argument('--sd-path', default=DEFAULT_SD_PATH,
@@ -355,6 +321,12 @@ Notes:
         # Validate arguments
         if args.n < 1 or args.n > 64:
             parser.error("Number of kits must be between 1 and 64")
+        if args.pool_size is not None and args.pool_size < 1:
+            parser.error("Pool size must be at least 1")
+
+        # Sampling with replacement doesn't need every source kit for small
+        # runs, so only load a pool proportional to N
+        pool_size = args.pool_size if args.pool_size is not None else min(64, max(16, args.n * 4))
 
         # Normalize bank ID
         try:
@@ -368,6 +340,7 @@ Notes:
         print(f"SD card path: {args.sd_path}")
         print(f"Output bank: {output_bank_id}")
         print(f"Number of kits: {args.n}")
+        print(f"Source kit pool: up to {pool_size} kits")
         if args.seed is not None:
             print(f"Random seed: {args.seed}")
         print()
@@ -377,17 +350,15 @@ Notes:
             print(f"✗ Error: SD card not found at {args.sd_path}")
             print(f"  Please ensure the Perkons SD card is mounted.")
             print(f"\nAvailable volumes:")
-            volumes = Path('/Volumes').iterdir() if Path('/Volumes').exists() else []
-            for vol in volumes:
-                if vol.is_dir():
-                    print(f"    - {vol}")
+            for vol in list_volumes():
+                print(f"    - {vol}")
             return 1
 
         print(f"✓ SD card found at {args.sd_path}")
 
         # Validate source banks
         print(f"\nValidating source banks...")
-        success, error_msg = validate_source_banks(args.sd_path)
+        success, error_msg, source_kit_entries = validate_source_banks(args.sd_path)
         if not success:
             print(f"✗ Error: {error_msg}")
             print(f"\nSource banks 01 and 02 must exist and contain kits.")
@@ -398,14 +369,13 @@ Notes:
 
         print(f"✓ Source banks validated")
         for bank_id in SOURCE_BANKS:
-            kit_count = get_kit_count_in_bank(args.sd_path, bank_id)
-            print(f"  Bank {bank_id}: {kit_count} kits")
+            print(f"  Bank {bank_id}: {len(source_kit_entries[bank_id])} kits")
 
         # Check output bank
         print(f"\nChecking output bank {output_bank_id}...")
-        if check_bank_exists(args.sd_path, output_bank_id):
-            if not is_bank_empty(args.sd_path, output_bank_id):
-                kit_count = get_kit_count_in_bank(args.sd_path, output_bank_id)
+        bank_exists, kit_count = inspect_bank(args.sd_path, output_bank_id)
+        if bank_exists:
+            if kit_count:
                 print(f"⚠ Warning: Output bank {output_bank_id} already exists with {kit_count} kit(s)")
 
                 if not args.force:
@@ -419,13 +389,13 @@ Notes:
         else:
             print(f"✓ Output bank does not exist (will be created)")
 
-        # Set random seed if provided
-        if args.seed is not None:
-            random.seed(args.seed)
+        # One generator for the run; without --seed it is seeded from the OS
+        rng = random.Random(args.seed)
 
         # Load source kits
         print(f"\nLoading source kits from banks 01 and 02...")
-        input_kits = load_source_kits(args.sd_path)
+        input_kits = load_source_kits(args.sd_path, source_kit_entries,
+                                      pool_size=pool_size, rng=rng)
 
         if not input_kits:
             print(f"\n✗ Error: No kits could be loaded from source banks")
@@ -434,19 +404,30 @@ Notes:
         print(f"\n✓ Loaded {len(input_kits)} source kit(s)")
 
         # Check kit formats
-        voice4_sizes = [len(kit.voices[3].data) for kit in input_kits]
-        format1_count = sum(1 for size in voice4_sizes if size == 30)
-        format2_count = sum(1 for size in voice4_sizes if size == 32)
+        # One pass counts both formats and remembers the first FORMAT 2 kit
+        format1_count = format2_count = 0
+        first_format2_kit = None
+        for kit in input_kits:
+            voice4_size = len(kit.voices[3].data)
+            if voice4_size == 30:
+                format1_count += 1
+            elif voice4_size == 32:
+                format2_count += 1
+                if first_format2_kit is None:
+                    first_format2_kit = kit
         print(f"  FORMAT 1: {format1_count} kits, FORMAT 2: {format2_count} kits")
 
         # Select template header
         print(f"\nPreparing output format...")
         print(f"  Output format: FORMAT 2 (voice 4 = 32 bytes)")
-        template_header = select_header_for_format2(input_kits)
+        template_header = select_header_for_format2(input_kits, first_format2_kit)
 
         # Create output directory
-        output_path = get_banks_directory(args.sd_path) / output_bank_id / 'KITS'
-        output_path.mkdir(parents=True, exist_ok=True)
+        bank_path = os.path.join(get_banks_directory(args.sd_path), output_bank_id)
+        output_path = os.path.join(bank_path, 'KITS')
+        # inspect_bank already proved KITS exists if it found kits in it
+        if not kit_count:
+            os.makedirs(output_path, exist_ok=True)
         print(f"\n✓ Output directory ready: {output_path}")
 
         # Confirm before proceeding
@@ -458,33 +439,38 @@ Notes:
 
         # Generate and save kits
         print(f"\nGenerating {args.n} random kit(s)...")
-        for i in range(args.n):
-            kit_filename = format_kit_filename(i)
-            kit_path = output_path / kit_filename
-
-            # Generate random kit
-            random_kit = generate_random_kit(input_kits,
-                                            output_format=2,
-                                            template_header=template_header)
-
-            # Save kit
-            random_kit.save(str(kit_path))
-            print(f"  Generated: {kit_filename}")
+        voice_pools = build_voice_pools(input_kits)
+        selections = select_voices(voice_pools, args.n, rng)
+        kit_files = []
+        add_kit_file = kit_files.append
+        for i, voices in enumerate(selections):
+            # Template header plus four voice references; nothing else varies per kit
+            random_kit = Kit(header=template_header)
+            set_voice = random_kit.set_voice
+            for voice_idx, voice in enumerate(voices):
+                set_voice(voice_idx, voice)
+            add_kit_file((format_kit_filename(i), random_kit.to_bytes()))
+
+        # Save all kits in one batch once everything is serialized
+        write_kit_files(output_path, kit_files)
+        print("\n".join(f"  Generated: {kit_filename}" for kit_filename, _ in kit_files))
 
         # Write info.md file
-        info_path = get_banks_directory(args.sd_path) / output_bank_id / 'info.md'
+        info_path = os.path.join(bank_path, 'info.md')
+        seed_line = f"- **Random Seed**: {args.seed}\n" if args.seed is not None else ""
         with open(info_path, 'w') as f:
-            f.write(f"# Bank {output_bank_id} - Random Kits\n\n")
-            f.write(f"## Generation Details\n\n")
-            f.write(f"- **Script**: pykons-randomise-kits\n")
-            f.write(f"- **Number of Kits**: {args.n}\n")
-            if args.seed is not None:
-                f.write(f"- **Random Seed**: {args.seed}\n")
-            f.write(f"- **Generated**: {__import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write(f"## Voice Sources\n\n")
-            f.write(f"Random voices sourced from:\n")
-            f.write(f"- Bank 01 (kits 00-31)\n")
-            f.write(f"- Bank 02 (kits 32-63)\n")
+            f.write(
+                f"# Bank {output_bank_id} - Random Kits\n\n"
+                f"## Generation Details\n\n"
+                f"- **Script**: pykons-randomise-kits\n"
+                f"- **Number of Kits**: {args.n}\n"
+                f"{seed_line}"
+                f"- **Generated**: {datetime.now():%Y-%m-%d %H:%M:%S}\n\n"
+                f"## Voice Sources\n\n"
+                f"Random voices sourced from:\n"
+                f"- Bank 01 (kits 00-31)\n"
+                f"- Bank 02 (kits 32-63)\n"
+            )
 
         print(f"\n✓ Successfully generated {args.n} kit(s) in bank {output_bank_id}")
         print(f"  Location: {output_path}")
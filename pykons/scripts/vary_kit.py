@@ -28,11 +28,17 @@ Usage:
 import argparse
 import os
 import random
+import re
 import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 
 # Import from parent package
 from pykons import Kit
+from pykons.scripts._sdcard import (
+    TWO_DIGIT, check_sd_card_mounted, get_banks_directory, inspect_bank,
+    list_volumes, load_kit_files, scan_bank,
+)
 
 
 # SD Card Configuration
@@ -42,32 +48,10 @@ SOURCE_KIT_RANGES = {
     '01': range(0, 32),   # Kits 00-31
     '02': range(32, 64)   # Kits 32-63
 }
+SAVE_CHECK_INTERVAL = 8  # variants queued between write checks/progress output
 
-
-def check_sd_card_mounted(sd_path):
-    """
-    Check if the SD card is mounted at the expected path.
-
-    Args:
-        sd_path: Expected mount point of SD card
-
-    Returns:
-        True if SD card is mounted, False otherwise
-    """
-    return os.path.exists(sd_path) and os.path.isdir(sd_path)
-
-
-def get_banks_directory(sd_path):
-    """
-    Get the BANKS directory path on the SD card.
-
-    Args:
-        sd_path: SD card mount point
-
-    Returns:
-        Path object for BANKS directory
-    """
-    return Path(sd_path) / 'BANKS'
+# Kit specification "XX:YY"; each side is validated separately
+_KIT_SPEC_RE = re.compile(r'([^:]*):([^:]*)')
 
 
 def parse_kit_spec(kit_spec):
@@ -83,36 +67,28 @@ def parse_kit_spec(kit_spec):
     Raises:
         ValueError: If format is invalid or numbers out of range
     """
-    if ':' not in kit_spec:
+    match = _KIT_SPEC_RE.fullmatch(kit_spec)
+    if not match:
         raise ValueError(f"Kit spec must be in format XX:YY, got '{kit_spec}'")
 
-    parts = kit_spec.split(':')
-    if len(parts) != 2:
-        raise ValueError(f"Kit spec must be in format XX:YY, got '{kit_spec}'")
-
-    bank_str, kit_str = parts
+    # Surrounding whitespace is tolerated, as int() would
+    bank_str, kit_str = match[1].strip(), match[2].strip()
 
     # Validate bank
-    try:
-        bank_num = int(bank_str)
-        if not 0 <= bank_num <= 63:
-            raise ValueError(f"Bank number must be 00-63, got {bank_num}")
-        bank_id = f"{bank_num:02d}"
-    except ValueError as e:
-        if "invalid literal" in str(e):
-            raise ValueError(f"Bank must be numeric 00-63, got '{bank_str}'")
-        raise
+    if not bank_str.isdecimal():
+        raise ValueError(f"Bank must be numeric 00-63, got '{match[1]}'")
+    bank_num = int(bank_str)
+    if not 0 <= bank_num <= 63:
+        raise ValueError(f"Bank number must be 00-63, got {bank_num}")
+    bank_id = TWO_DIGIT[bank_num]
 
     # Validate kit
-    try:
-        kit_num = int(kit_str)
-        if not 0 <= kit_num <= 63:
-            raise ValueError(f"Kit number must be 00-63, got {kit_num}")
-        kit_id = f"{kit_num:02d}"
-    except ValueError as e:
-        if "invalid literal" in str(e):
-            raise ValueError(f"Kit must be numeric 00-63, got '{kit_str}'")
-        raise
+    if not kit_str.isdecimal():
+        raise ValueError(f"Kit must be numeric 00-63, got '{match[2]}'")
+    kit_num = int(kit_str)
+    if not 0 <= kit_num <= 63:
+        raise ValueError(f"Kit number must be 00-63, got {kit_num}")
+    kit_id = TWO_DIGIT[kit_num]
 
     return bank_id, kit_id
 
@@ -127,11 +103,11 @@ def validate_kit_exists(sd_path, bank_id, kit_id):
         kit_id: Kit ID (e.g., '05')
 
     Returns:
-        Tuple of (exists: bool, kit_path: Path, error_msg: str or None)
+        Tuple of (exists: bool, kit_path: str, error_msg: str or None)
     """
-    kit_path = get_banks_directory(sd_path) / bank_id / 'KITS' / f"{kit_id}.KIT"
+    kit_path = os.path.join(get_banks_directory(sd_path), bank_id, 'KITS', f"{kit_id}.KIT")
 
-    if not kit_path.exists():
+    if not os.path.isfile(kit_path):
         return False, kit_path, f"Kit file not found: {bank_id}:KITS/{kit_id}.KIT"
 
     return True, kit_path, None
@@ -150,191 +126,199 @@ def normalize_bank_id(bank_input):
     Raises:
         ValueError: If bank is out of range or in protected range
     """
-    try:
-        bank_num = int(bank_input)
-        if not 0 <= bank_num <= 63:
-            raise ValueError(f"Bank number must be between 0 and 63, got {bank_num}")
+    bank_str = str(bank_input).strip()
+    if not bank_str.isdecimal():
+        raise ValueError(f"Bank must be a number between 0-63, got '{bank_input}'")
 
-        bank_id = f"{bank_num:02d}"
+    bank_num = int(bank_str)
+    if not 0 <= bank_num <= 63:
+        raise ValueError(f"Bank number must be between 0 and 63, got {bank_num}")
 
-        # Check if trying to write to source banks
-        if bank_id in SOURCE_BANKS:
-            raise ValueError(f"Cannot write to source bank {bank_id}. Source banks (01, 02) are read-only.")
+    bank_id = TWO_DIGIT[bank_num]
 
-        return bank_id
-    except ValueError as e:
-        if "invalid literal" in str(e):
-            raise ValueError(f"Bank must be a number between 0-63, got '{bank_input}'")
-        raise
+    # Check if trying to write to source banks
+    if bank_id in SOURCE_BANKS:
+        raise ValueError(f"Cannot write to source bank {bank_id}. Source banks (01, 02) are read-only.")
 
-
-def check_bank_exists(sd_path, bank_id):
-    """
-    Check if a bank exists on the SD card.
-
-    Args:
-        sd_path: SD card mount point
-        bank_id: Bank ID (e.g., '01', '10')
-
-    Returns:
-        True if bank directory exists, False otherwise
-    """
-    bank_path = get_banks_directory(sd_path) / bank_id
-    return bank_path.exists()
+    return bank_id
 
 
-def is_bank_empty(sd_path, bank_id):
+def validate_source_banks(sd_path):
     """
-    Check if a bank is empty (no kits or only empty KITS directory).
+    Validate that source banks 01 and 02 exist and contain kits.
 
     Args:
         sd_path: SD card mount point
-        bank_id: Bank ID (e.g., '01', '10')
 
     Returns:
-        True if bank doesn't exist or has no .KIT files, False otherwise
+        Tuple of (success: bool, error_message: str or None, kit_entries: dict)
+        where kit_entries maps each source bank found to its scan_bank()
+        (filename, kit_num, size) entries, so callers needn't scan again
     """
-    bank_path = get_banks_directory(sd_path) / bank_id
-
-    if not bank_path.exists():
-        return True
+    banks_dir = get_banks_directory(sd_path)
 
-    kits_path = bank_path / 'KITS'
-    if not kits_path.exists():
-        return True
+    if not os.path.isdir(banks_dir):
+        return False, f"BANKS directory not found on SD card at {banks_dir}", {}
 
-    # Check if any .KIT files exist
-    kit_files = list(kits_path.glob('*.KIT')) + list(kits_path.glob('*.kit'))
-    return len(kit_files) == 0
+    missing_banks = []
+    empty_banks = []
+    kit_entries = {}
 
+    for bank_id in SOURCE_BANKS:
+        bank_exists, _, entries, _ = scan_bank(sd_path, bank_id, with_size=False)
+        if not bank_exists:
+            missing_banks.append(bank_id)
+            continue
 
-def get_kit_count_in_bank(sd_path, bank_id):
-    """
-    Count the number of .KIT files in a bank.
+        # Check if bank has kits in its source range
+        kit_entries[bank_id] = entries
+        kit_range = SOURCE_KIT_RANGES[bank_id]
+        if not any(kit_num in kit_range for _, kit_num, _ in entries):
+            empty_banks.append(bank_id)
 
-    Args:
-        sd_path: SD card mount point
-        bank_id: Bank ID
+    if missing_banks:
+        return False, f"Source banks not found: {', '.join(missing_banks)}", kit_entries
 
-    Returns:
-        Number of .KIT files in the bank
-    """
-    kits_path = get_banks_directory(sd_path) / bank_id / 'KITS'
-    if not kits_path.exists():
-        return 0
+    if empty_banks:
+        return False, f"Source banks are empty: {', '.join(empty_banks)}", kit_entries
 
-    kit_files = list(kits_path.glob('*.KIT')) + list(kits_path.glob('*.kit'))
-    return len(kit_files)
+    return True, None, kit_entries
 
 
-def validate_source_banks(sd_path):
+def list_source_kits(sd_path, source_kit_entries):
     """
-    Validate that source banks 01 and 02 exist and contain kits.
+    List the mutation source kits in banks 01 and 02, without loading them.
 
     Args:
         sd_path: SD card mount point
+        source_kit_entries: Dict of {bank_id: scan_bank() kit entries} from
+            validate_source_banks(); only kits in each bank's source range
+            are listed
 
     Returns:
-        Tuple of (success: bool, error_message: str or None)
+        List of (bank_id, kit_filename, kit_path) tuples in bank/kit order,
+        one per kit number
     """
     banks_dir = get_banks_directory(sd_path)
 
-    if not banks_dir.exists():
-        return False, f"BANKS directory not found on SD card at {banks_dir}"
-
-    missing_banks = []
-    empty_banks = []
-
+    candidates = []
     for bank_id in SOURCE_BANKS:
-        bank_path = banks_dir / bank_id
-        kits_path = bank_path / 'KITS'
+        kit_range = SOURCE_KIT_RANGES[bank_id]
+        by_num = {}
+        for name, kit_num, _ in sorted(source_kit_entries.get(bank_id, ())):
+            if kit_num in kit_range:
+                by_num.setdefault(kit_num, name)
+        kits_path = os.path.join(banks_dir, bank_id, 'KITS')
+        candidates.extend((bank_id, name, os.path.join(kits_path, name))
+                          for _, name in sorted(by_num.items()))
 
-        if not bank_path.exists():
-            missing_banks.append(bank_id)
-            continue
+    return candidates
 
-        if not kits_path.exists():
-            empty_banks.append(bank_id)
-            continue
 
-        # Check if bank has kits
-        kit_count = get_kit_count_in_bank(sd_path, bank_id)
-        if kit_count == 0:
-            empty_banks.append(bank_id)
+def plan_mutations(n_variants, n_mutations, n_candidates):
+    """
+    Draw the mutations of every variant up front.
 
-    if missing_banks:
-        return False, f"Source banks not found: {', '.join(missing_banks)}"
+    Args:
+        n_variants: Number of variants, including the unvaried first one
+        n_mutations: Number of voices to mutate per variant
+        n_candidates: Number of source kits replacement voices are drawn from
 
-    if empty_banks:
-        return False, f"Source banks are empty: {', '.join(empty_banks)}"
+    Returns:
+        List with one dict per variant, mapping each mutated voice index to
+        the index of the source kit its replacement comes from; the first
+        variant (the unvaried source kit) has none
+    """
+    # Replacements are drawn in selection order so seeded runs don't change
+    plan = [{}]
+    for _ in range(1, n_variants):
+        voices_to_mutate = random.sample(range(4), n_mutations)
+        plan.append({voice_idx: random.randrange(n_candidates) for voice_idx in voices_to_mutate})
 
-    return True, None
+    return plan
 
 
-def load_source_kits(sd_path):
+def load_mutation_kits(candidates, n_variants, n_mutations):
     """
-    Load all source kits from banks 01 and 02.
+    Plan the mutations and load only the source kits they draw from.
+
+    Source kits that are missing or fail to load are dropped from the
+    candidates and the mutations are drawn again.
 
     Args:
-        sd_path: SD card mount point
+        candidates: Source kits from list_source_kits()
+        n_variants: Number of variants, including the unvaried first one
+        n_mutations: Number of voices to mutate per variant
 
     Returns:
-        List of Kit objects
+        Tuple of (list with one dict per variant mapping each mutated voice
+        index to its replacement Voice, or None if no source kit could be
+        loaded; number of source kits loaded)
     """
-    kits = []
-    banks_dir = get_banks_directory(sd_path)
-
-    for bank_id in SOURCE_BANKS:
-        kit_range = SOURCE_KIT_RANGES[bank_id]
+    loaded = {}
+    while candidates:
+        plan = plan_mutations(n_variants, n_mutations, len(candidates))
+        needed = sorted({idx for mutations in plan for idx in mutations.values()})
+        tasks = [candidates[idx] for idx in needed if candidates[idx][:2] not in loaded]
+
+        failed = set()
+        for bank_id, kit_filename, kit, error in load_kit_files(tasks):
+            if kit is not None:
+                loaded[bank_id, kit_filename] = kit
+            else:
+                failed.add((bank_id, kit_filename))
+                if error is not None:
+                    print(f"  Warning: Failed to load {bank_id}/KITS/{kit_filename}: {error}")
 
-        for kit_num in kit_range:
-            kit_filename = f"{kit_num:02d}.KIT"
-            kit_path = banks_dir / bank_id / 'KITS' / kit_filename
+        if not failed:
+            return [
+                {voice_idx: loaded[candidates[idx][:2]].get_voice(voice_idx)
+                 for voice_idx, idx in mutations.items()}
+                for mutations in plan
+            ], len(loaded)
 
-            if kit_path.exists():
-                try:
-                    kit = Kit.from_file(str(kit_path))
-                    kits.append(kit)
-                except Exception as e:
-                    print(f"  Warning: Failed to load {bank_id}/KITS/{kit_filename}: {e}")
+        candidates = [task for task in candidates if task[:2] not in failed]
 
-    return kits
+    return None, len(loaded)
 
 
-def generate_variation(source_kit, mutation_kits, n_mutations):
+def generate_variation(source_kit, replacements, variation=None):
     """
-    Generate a variation of the source kit by mutating n voices.
+    Generate a variation of the source kit by replacing some of its voices.
 
     Args:
         source_kit: Kit object to vary
-        mutation_kits: List of Kit objects to pull replacement voices from
-        n_mutations: Number of voices to mutate (1-4)
+        replacements: Dict mapping each voice index to mutate to its
+            replacement Voice, from load_mutation_kits()
+        variation: Kit to overwrite in place, e.g. one reused for every
+            variant; all four voices are replaced, the header is kept
+            (default: a new kit with a copy of the source header)
 
     Returns:
-        Kit object with mutated voices
+        Tuple of (Kit object with mutated voices, sorted list of mutated
+        voice indices)
     """
-    # Create a copy of the source kit
-    variation = Kit()
-    variation.header = bytearray(source_kit.header)
-
-    # Copy all voices initially
-    for i in range(4):
-        variation.set_voice(i, source_kit.get_voice(i))
+    # Build the variation in one pass, taking each voice from either the
+    # source kit or its replacement
+    if variation is None:
+        variation = Kit(header=source_kit.header)
+    for voice_idx in range(4):
+        voice = replacements.get(voice_idx)
+        variation.set_voice(voice_idx, voice if voice is not None else source_kit.get_voice(voice_idx))
 
-    # Select which voices to mutate
-    voice_indices = list(range(4))
-    voices_to_mutate = random.sample(voice_indices, n_mutations)
+    return variation, sorted(replacements)
 
-    # Mutate selected voices
-    for voice_idx in voices_to_mutate:
-        # Pick a random source kit
-        mutation_source = random.choice(mutation_kits)
-        replacement_voice = mutation_source.get_voice(voice_idx)
 
-        # Replace the voice
-        variation.set_voice(voice_idx, replacement_voice)
+def write_kit_file(kit_path, data):
+    """
+    Write serialized kit data to a .KIT file.
 
-    return variation, voices_to_mutate
+    Args:
+        kit_path: Path of the .KIT file to write
+        data: Kit bytes from Kit.to_bytes()
+    """
+    with open(kit_path, 'wb') as f:
+        f.write(data)
 
 
 def format_kit_filename(kit_number):
@@ -444,10 +428,8 @@ Notes:
             print(f"✗ Error: SD card not found at {args.sd_path}")
             print(f"  Please ensure the Perkons SD card is mounted.")
             print(f"\nAvailable volumes:")
-            volumes = Path('/Volumes').iterdir() if Path('/Volumes').exists() else []
-            for vol in volumes:
-                if vol.is_dir():
-                    print(f"    - {vol}")
+            for vol in list_volumes():
+                print(f"    - {vol}")
             return 1
 
         print(f"✓ SD card found at {args.sd_path}")
@@ -465,7 +447,7 @@ Notes:
 
         # Load source kit
         try:
-            source_kit = Kit.from_file(str(source_kit_path))
+            source_kit = Kit.from_file(source_kit_path)
             print(f"  Header: {len(source_kit.header)} bytes")
             print(f"  Voices: {[len(v.data) for v in source_kit.voices]} bytes")
         except Exception as e:
@@ -474,7 +456,7 @@ Notes:
 
         # Validate source banks
         print(f"\nValidating source banks for mutations...")
-        success, error_msg = validate_source_banks(args.sd_path)
+        success, error_msg, source_kit_entries = validate_source_banks(args.sd_path)
         if not success:
             print(f"✗ Error: {error_msg}")
             print(f"\nSource banks 01 and 02 must exist and contain kits.")
@@ -482,14 +464,13 @@ Notes:
 
         print(f"✓ Source banks validated")
         for bank_id in SOURCE_BANKS:
-            kit_count = get_kit_count_in_bank(args.sd_path, bank_id)
-            print(f"  Bank {bank_id}: {kit_count} kits")
+            print(f"  Bank {bank_id}: {len(source_kit_entries[bank_id])} kits")
 
         # Check output bank
         print(f"\nChecking output bank {output_bank_id}...")
-        if check_bank_exists(args.sd_path, output_bank_id):
-            if not is_bank_empty(args.sd_path, output_bank_id):
-                kit_count = get_kit_count_in_bank(args.sd_path, output_bank_id)
+        bank_exists, kit_count = inspect_bank(args.sd_path, output_bank_id)
+        if bank_exists:
+            if kit_count:
                 print(f"⚠ Warning: Output bank {output_bank_id} already exists with {kit_count} kit(s)")
 
                 if not args.force:
@@ -507,19 +488,22 @@ Notes:
         if args.seed is not None:
             random.seed(args.seed)
 
-        # Load mutation source kits
+        # Load mutation source kits. Replacements are drawn from every
+        # candidate kit, but only the kits actually drawn are read
         print(f"\nLoading mutation source kits from banks 01 and 02...")
-        mutation_kits = load_source_kits(args.sd_path)
+        mutations, n_loaded = load_mutation_kits(
+            list_source_kits(args.sd_path, source_kit_entries), args.n_variants, args.n_mutations
+        )
 
-        if not mutation_kits:
+        if mutations is None:
             print(f"\n✗ Error: No kits could be loaded from source banks")
             return 1
 
-        print(f"\n✓ Loaded {len(mutation_kits)} mutation source kit(s)")
+        print(f"\n✓ Loaded {n_loaded} mutation source kit(s)")
 
         # Create output directory
-        output_path = get_banks_directory(args.sd_path) / output_bank_id / 'KITS'
-        output_path.mkdir(parents=True, exist_ok=True)
+        output_path = os.path.join(get_banks_directory(args.sd_path), output_bank_id, 'KITS')
+        os.makedirs(output_path, exist_ok=True)
         print(f"\n✓ Output directory ready: {output_path}")
 
         # Confirm before proceeding
@@ -531,49 +515,67 @@ Notes:
 
         # Generate and save variants
         print(f"\nGenerating {args.n_variants} variant(s) of {source_bank_id}:{source_kit_id}...")
-        for i in range(args.n_variants):
-            kit_filename = format_kit_filename(i)
-            kit_path = output_path / kit_filename
-
-            if i == 0:
-                # First kit is always the unvaried source kit
-                variant_kit = Kit()
-                variant_kit.header = bytearray(source_kit.header)
-                for v_idx in range(4):
-                    variant_kit.set_voice(v_idx, source_kit.get_voice(v_idx))
-
-                variant_kit.save(str(kit_path))
-                print(f"  Generated: {kit_filename} (original, unvaried)")
-            else:
-                # Generate variation
-                variant_kit, mutated_voices = generate_variation(
-                    source_kit, mutation_kits, args.n_mutations
-                )
+        # One Kit is reused for every variant: each one keeps the source header
+        # and has all four voices overwritten
+        variant_kit = Kit(header=source_kit.header)
+
+        # Each variant is serialized straight away, so the kit can be reused,
+        # and its bytes are written on a background writer so card writes
+        # overlap building the next variant. Every few variants the queued
+        # writes are waited on, so write errors surface, and their progress
+        # lines are printed in one go
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            pending = []
+            log_buf = []
+
+            def flush():
+                for future in pending:
+                    future.result()
+                pending.clear()
+                sys.stdout.write(''.join(log_buf))
+                log_buf.clear()
+
+            # First kit is always the unvaried source kit
+            for i, replacements in enumerate(mutations):
+                kit_filename = format_kit_filename(i)
+                kit_path = os.path.join(output_path, kit_filename)
+
+                _, mutated_voices = generate_variation(source_kit, replacements, variation=variant_kit)
 
                 # Save kit
-                variant_kit.save(str(kit_path))
-                voice_names = [f"V{v+1}" for v in mutated_voices]
-                print(f"  Generated: {kit_filename} (mutated: {', '.join(voice_names)})")
+                pending.append(writer.submit(write_kit_file, kit_path, variant_kit.to_bytes()))
+                if i == 0:
+                    log_buf.append(f"  Generated: {kit_filename} (original, unvaried)\n")
+                else:
+                    voice_names = [f"V{v+1}" for v in mutated_voices]
+                    log_buf.append(f"  Generated: {kit_filename} (mutated: {', '.join(voice_names)})\n")
+
+                if len(pending) >= SAVE_CHECK_INTERVAL:
+                    flush()
+
+            flush()
 
         # Write info.md file
-        info_path = get_banks_directory(args.sd_path) / output_bank_id / 'info.md'
+        info_path = os.path.join(get_banks_directory(args.sd_path), output_bank_id, 'info.md')
+        seed_line = f"- **Random Seed**: {args.seed}\n" if args.seed is not None else ""
         with open(info_path, 'w') as f:
-            f.write(f"# Bank {output_bank_id} - Kit Variations\n\n")
-            f.write(f"## Generation Details\n\n")
-            f.write(f"- **Script**: pykons-vary-kit\n")
-            f.write(f"- **Source Kit**: {source_bank_id}:{source_kit_id}\n")
-            f.write(f"- **Number of Variants**: {args.n_variants}\n")
-            f.write(f"- **Mutations per Variant**: {args.n_mutations} voices\n")
-            if args.seed is not None:
-                f.write(f"- **Random Seed**: {args.seed}\n")
-            f.write(f"- **Generated**: {__import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write(f"## Kit Details\n\n")
-            f.write(f"- **Kit 00**: Original source kit (unvaried)\n")
-            f.write(f"- **Kits 01-{args.n_variants-1:02d}**: Variations with {args.n_mutations} voice(s) mutated\n\n")
-            f.write(f"## Voice Sources\n\n")
-            f.write(f"Mutation voices sourced from:\n")
-            f.write(f"- Bank 01 (kits 00-31)\n")
-            f.write(f"- Bank 02 (kits 32-63)\n")
+            f.write(
+                f"# Bank {output_bank_id} - Kit Variations\n\n"
+                f"## Generation Details\n\n"
+                f"- **Script**: pykons-vary-kit\n"
+                f"- **Source Kit**: {source_bank_id}:{source_kit_id}\n"
+                f"- **Number of Variants**: {args.n_variants}\n"
+                f"- **Mutations per Variant**: {args.n_mutations} voices\n"
+                f"{seed_line}"
+                f"- **Generated**: {datetime.now():%Y-%m-%d %H:%M:%S}\n\n"
+                f"## Kit Details\n\n"
+                f"- **Kit 00**: Original source kit (unvaried)\n"
+                f"- **Kits 01-{args.n_variants-1:02d}**: Variations with {args.n_mutations} voice(s) mutated\n\n"
+                f"## Voice Sources\n\n"
+                f"Mutation voices sourced from:\n"
+                f"- Bank 01 (kits 00-31)\n"
+                f"- Bank 02 (kits 32-63)\n"
+            )
 
         print(f"\n✓ Successfully generated {args.n_variants} variant(s) in bank {output_bank_id}")
         print(f"  Source: {source_bank_id}:{source_kit_id}")
@@ -0,0 +1,123 @@
+"""
+Tests for pykons.kit_tools
+"""
+
+import unittest
+
+from pykons import Kit, Voice
+from pykons.kit_tools import _MARKER
+
+
+def _voice_bytes(size, first=0):
+    """Voice data of the given size: pre-marker bytes, marker, then filler"""
+    return bytes(range(first, first + 4)) + _MARKER + bytes(size - 8)
+
+
+def _kit_bytes(v4_size=30, header_size=57):
+    """Kit data with a zeroed header, three 26-byte voices and voice 4"""
+    return (bytes(header_size)
+            + _voice_bytes(26, 1) + _voice_bytes(26, 2) + _voice_bytes(26, 3)
+            + _voice_bytes(v4_size, 4))
+
+
+class KitParsingTest(unittest.TestCase):
+
+    def test_memoryview_round_trip(self):
+        data = Kit().to_bytes()
+        kit = Kit(memoryview(data))
+        self.assertEqual(kit.to_bytes(), data)
+
+    def test_find_markers_fixed_offsets(self):
+        data = _kit_bytes()
+        self.assertEqual(Kit._find_markers(data), (61, 87, 113, 139))
+
+    def test_find_markers_fallback_scan(self):
+        # Voice 2 is 2 bytes too long, so markers 3 and 4 aren't at the fixed offsets
+        data = bytes(10) + _MARKER + bytes(22) + _MARKER + bytes(24) + _MARKER + bytes(22) + _MARKER
+        self.assertEqual(Kit._find_markers(data), (10, 36, 64, 90))
+
+    def test_find_markers_ignores_marker_bytes_in_voice4(self):
+        # A marker-like run inside voice 4 doesn't matter once the fixed offsets match
+        data = bytes(10) + (_MARKER + bytes(22)) * 5
+        self.assertEqual(Kit._find_markers(data), (10, 36, 62, 88))
+
+    def test_find_markers_wrong_count(self):
+        with self.assertRaisesRegex(ValueError, "found 3"):
+            Kit._find_markers(bytes(10) + (_MARKER + bytes(22)) * 3)
+        with self.assertRaisesRegex(ValueError, "more than 4"):
+            Kit._find_markers(bytes(10) + (_MARKER + bytes(24)) * 5)
+        with self.assertRaisesRegex(ValueError, "found 0"):
+            Kit._find_markers(bytes(100))
+
+    def test_format1_voice4(self):
+        data = _kit_bytes(v4_size=30)
+        kit = Kit(data)
+        voice4 = kit.get_voice(3)
+        self.assertEqual(len(kit.header), 57)
+        self.assertTrue(voice4.is_voice4)
+        self.assertFalse(voice4.has_sampler)
+        self.assertEqual(len(voice4.extra_params), 4)
+        self.assertIsNone(voice4.sampler_params)
+        self.assertEqual(kit.to_bytes(), data)
+
+    def test_format2_voice4(self):
+        data = _kit_bytes(v4_size=32)
+        kit = Kit(data)
+        voice4 = kit.get_voice(3)
+        self.assertTrue(voice4.is_voice4)
+        self.assertTrue(voice4.has_sampler)
+        self.assertEqual(len(voice4.sampler_params), 2)
+        self.assertEqual(kit.to_bytes(), data)
+
+    def test_set_voice4_widens_to_kit_format(self):
+        for v4_size in (30, 32):
+            kit = Kit(_kit_bytes(v4_size=v4_size))
+            kit.set_voice(3, kit.get_voice(0))
+            self.assertEqual(len(kit.get_voice(3).data), v4_size)
+
+    def test_get_voice_range(self):
+        kit = Kit()
+        self.assertIs(kit.get_voice(3), kit.voices[3])
+        for index in (-1, 4):
+            with self.assertRaisesRegex(ValueError, "0-3"):
+                kit.get_voice(index)
+
+
+class VoiceParamsTest(unittest.TestCase):
+
+    def test_from_params(self):
+        voice = Voice.from_params(algo=2, vcf=1, tune=200, level=255, is_voice4=True)
+        self.assertEqual((voice.algo, voice.vcf, voice.tune, voice.level), (2, 1, 200, 255))
+        self.assertEqual(len(voice.data), 30)
+
+    def test_from_params_validation(self):
+        with self.assertRaisesRegex(ValueError, "VCF"):
+            Voice.from_params(vcf=3)
+        with self.assertRaisesRegex(ValueError, "DECAY"):
+            Voice.from_params(decay=256)
+        with self.assertRaisesRegex(ValueError, "TUNE"):
+            Voice.from_params(tune=-1)
+
+    def test_pack_params_round_trip(self):
+        voice = Voice.from_params()
+        voice.pack_params(tune=12, vcf=2, unused=7)
+        params = voice.unpack_params()
+        self.assertEqual((params['tune'], params['vcf'], params['unused']), (12, 2, 7))
+        self.assertEqual(voice.tune, 12)
+
+    def test_pack_params_validation(self):
+        voice = Voice.from_params()
+        before = bytes(voice.data)
+        with self.assertRaisesRegex(ValueError, "Unknown"):
+            voice.pack_params(algo=1)
+        with self.assertRaisesRegex(ValueError, "VCF"):
+            voice.pack_params(vcf=200)
+        with self.assertRaisesRegex(ValueError, "0-255"):
+            voice.pack_params(tune=256)
+        with self.assertRaises(TypeError):
+            voice.pack_params(tune='x')
+        self.assertEqual(bytes(voice.data), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+"""
+Tests for the SD card script helpers
+"""
+
+import unittest
+
+from pykons.scripts._sdcard import parse_kit_name
+from pykons.scripts.delete_bank import get_kit_ranges_for_cleaning
+
+
+class ParseKitNameTest(unittest.TestCase):
+
+    def test_valid_names(self):
+        self.assertEqual(parse_kit_name('00.KIT'), 0)
+        self.assertEqual(parse_kit_name('05.KIT'), 5)
+        self.assertEqual(parse_kit_name('63.KIT'), 63)
+        self.assertEqual(parse_kit_name('07.kit'), 7)
+        self.assertEqual(parse_kit_name('07.Kit'), 7)
+
+    def test_invalid_names(self):
+        for name in ('64.KIT', '99.KIT', '5.KIT', '005.KIT', 'ab.KIT', '0a.KIT',
+                     '05.TXT', '05KIT.', 'notes.kit', ''):
+            self.assertEqual(parse_kit_name(name), -1, name)
+
+
+class KitRangesForCleaningTest(unittest.TestCase):
+
+    def test_bank_01(self):
+        keep_range, delete_range, delete_names, description = get_kit_ranges_for_cleaning('01')
+        self.assertEqual(keep_range, range(0, 32))
+        self.assertEqual(delete_range, range(32, 64))
+        self.assertEqual(delete_names, frozenset(f"{num:02d}.KIT" for num in range(32, 64)))
+        self.assertEqual(description, "kits 32-63")
+
+    def test_bank_02(self):
+        keep_range, delete_range, delete_names, description = get_kit_ranges_for_cleaning('02')
+        self.assertEqual(keep_range, range(32, 64))
+        self.assertEqual(delete_range, range(0, 32))
+        self.assertEqual(delete_names, frozenset(f"{num:02d}.KIT" for num in range(0, 32)))
+        self.assertEqual(description, "kits 00-31")
+
+    def test_other_banks(self):
+        for bank_id in ('00', '03', '10'):
+            self.assertEqual(get_kit_ranges_for_cleaning(bank_id), (None, None, None, None))
+
+
+if __name__ == '__main__':
+    unittest.main()